@@ -143,7 +143,7 @@ type_targets = {
         "pluggy._manager.PluginManager",
         "_DI",
         "_DO",
-        # The statements below were added after subclassing UserDict in AbstractConfigLoader.
+        # The statements below were added after subclassing dict in AbstractConfigLoader.
         "None.  Remove all items from D.",
         "a shallow copy of D",
         "a set-like object providing a view on D's items",
@@ -1,17 +1,20 @@
 """This module provides ``kedro.abstract_config`` with the baseline
 class model for a `ConfigLoader` implementation.
 """
-from collections import UserDict
 from typing import Any, Dict
 
 
-class AbstractConfigLoader(UserDict):
+class AbstractConfigLoader(dict):
     """``AbstractConfigLoader`` is the abstract base class
         for all `ConfigLoader` implementations.
     All user-defined `ConfigLoader` implementations should inherit
         from `AbstractConfigLoader` and implement all relevant abstract methods.
+    Its attributes are stored in ``__slots__``; subclasses which should not have
+        an instance ``__dict__`` either need to declare their own ``__slots__``.
     """
 
+    __slots__ = ("conf_source", "env", "runtime_params")
+
     def __init__(
         self,
         conf_source: str,
@@ -24,6 +27,17 @@ class AbstractConfigLoader(UserDict):
         self.env = env
         self.runtime_params = runtime_params
 
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The loaded configuration, kept for backwards compatibility with
+        config loaders written when ``AbstractConfigLoader`` was a ``UserDict``."""
+        return self
+
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self.clear()
+        self.update(value)
+
 
 class BadConfigException(Exception):
     """Raised when a configuration file cannot be loaded, for instance
@@ -2,12 +2,13 @@
 filesystem (e.g.: local, S3, GCS). It uses pandas to handle the
 type of read/write target.
 """
-from copy import deepcopy
+import re
+from importlib.util import find_spec
 from pathlib import PurePosixPath
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Set, Tuple, Union
 
-import fsspec
-import pandas as pd
+import importlib_metadata
+from cachetools import LRUCache
 
 from kedro.io.core import (
     AbstractVersionedDataSet,
@@ -17,19 +18,71 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
-NON_FILE_SYSTEM_TARGETS = [
-    "clipboard",
-    "numpy",
-    "sql",
-    "period",
-    "records",
-    "timestamp",
-    "xarray",
-    "sql_table",
-]
+# pandas and fsspec are only imported once a dataset is created, not with this module
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Read buffer and ``fsspec`` block size used for columnar files on remote filesystems;
+# Parquet column chunks are also pre-buffered so they are fetched in coalesced requests
+REMOTE_COLUMNAR_BUFFER_SIZE = 256 * 1024
+COLUMNAR_FORMATS = ("parquet", "feather", "orc")
+# Arrow to pandas conversion converts columns in parallel, releasing the Arrow
+# memory of each column once it has been converted. `split_blocks` is not used
+# as it makes the resulting DataFrames read-only.
+ARROW_TO_PANDAS_ARGS = {
+    "use_threads": True,
+    "self_destruct": True,
+}
+
+# Oldest ``pyarrow`` version whose ``ParquetFile`` supports ``iter_batches``, below
+# which Parquet files are read with ``pandas.read_parquet``
+PYARROW_MIN_VERSION = (3, 0)
+# Oldest ``pyarrow`` version whose ``ParquetFile`` accepts ``pre_buffer``
+PYARROW_PRE_BUFFER_MIN_VERSION = (5, 0)
+
+NON_FILE_SYSTEM_TARGETS = frozenset(
+    {
+        "clipboard",
+        "numpy",
+        "sql",
+        "period",
+        "records",
+        "timestamp",
+        "xarray",
+        "sql_table",
+    }
+)
+
+
+def _iter_and_close(fs_file: Any, iterator: Iterator[Any]) -> Iterator[Any]:
+    """Yield from ``iterator``, closing the file it reads from once it is exhausted."""
+    with fs_file:
+        yield from iterator
+
+
+def _get_pyarrow_version() -> Optional[Tuple[int, ...]]:
+    """Get the installed ``pyarrow`` version as ``(major, minor)``, without
+    importing it, or None if it is not installed."""
+    try:
+        version = importlib_metadata.version("pyarrow")
+    except importlib_metadata.PackageNotFoundError:
+        return None
+    return tuple(int(part) for part in re.findall(r"\d+", version)[:2])
+
+
+def _shallow_config_copy(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a configuration dictionary and its nested dicts and lists, which is
+    all that is needed to keep JSON-like arguments from being mutated and is much
+    cheaper than ``deepcopy``."""
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in config.items()
+    }
 
 
-class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
+class GenericDataSet(
+    AbstractVersionedDataSet["pd.DataFrame", "pd.DataFrame"]
+):  # pylint: disable=too-many-instance-attributes
     """`pandas.GenericDataSet` loads/saves data from/to a data file using an underlying
     filesystem (e.g.: local, S3, GCS). It uses pandas to dynamically select the
     appropriate type of read/write target on a best effort basis.
@@ -84,7 +137,8 @@ class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
     DEFAULT_LOAD_ARGS = {}  # type: Dict[str, Any]
     DEFAULT_SAVE_ARGS = {}  # type: Dict[str, Any]
 
-    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    # pylint: disable=too-many-statements
     def __init__(
         self,
         filepath: str,
@@ -94,6 +148,7 @@ class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
         version: Version = None,
         credentials: Dict[str, Any] = None,
         fs_args: Dict[str, Any] = None,
+        cache: Union[bool, int] = False,
     ):
         """Creates a new instance of ``GenericDataSet`` pointing to a concrete data file
         on a specific filesystem. The appropriate pandas load/save methods are
@@ -116,6 +171,23 @@ class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/reference/io.html
                 All defaults are preserved.
+                For the 'parquet' file format, files are read with ``pyarrow`` so that
+                only the requested ``columns`` are decoded. Setting ``chunked`` to True
+                makes ``load`` return an iterator of DataFrames, each holding at most
+                ``batch_size`` rows (65536 by default); only ``columns`` is supported
+                together with it. Without ``pyarrow`` 3.0 or later, files are read
+                with ``pandas.read_parquet`` and cannot be loaded in chunks.
+                Local 'feather' files are memory-mapped by ``pyarrow`` instead of
+                being read through a file buffer.
+                For the 'csv' file format, ``columns`` is passed on as ``usecols`` and
+                setting ``chunked`` to True (or passing a ``chunksize``) makes ``load``
+                return an iterator of DataFrames of ``chunksize`` rows (100000 by
+                default).
+                For the 'json' file format, ``engine: orjson`` parses files with
+                ``orjson`` and builds the DataFrame directly from the parsed records or
+                columns, skipping the dtype and date inference of ``pandas.read_json``.
+                The index of column-oriented files is made of the JSON object keys,
+                i.e. strings. Only the ``lines`` option is supported together with it.
             save_args: Pandas options for saving files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/reference/io.html
@@ -133,25 +205,45 @@ class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
                 Here you can find all available arguments for `open`:
                 https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.spec.AbstractFileSystem.open
                 All defaults are preserved, except `mode`, which is set to `r` when loading
-                and to `w` when saving.
+                and to `w` when saving, and `block_size`, which is set to 256 KiB when
+                loading 'parquet', 'feather' or 'orc' files from a remote filesystem.
+            cache: Number of loaded DataFrames to keep in memory, so that loading an
+                unchanged file again returns a copy of the cached DataFrame instead of
+                reading it. Files are identified by their path and their ``fsspec``
+                ``ukey``, which changes when the file is modified. ``True`` keeps the
+                most recently loaded DataFrame only. Disabled by default.
 
         Raises:
             DataSetError: Will be raised if at least less than one appropriate
                 read or write methods are identified.
         """
 
+        # pylint: disable=import-outside-toplevel
+        import fsspec
+        import pandas as pd
+
         self._file_format = file_format.lower()
+        self._load_method = getattr(pd, f"read_{self._file_format}", None)
+        self._save_method_name = f"to_{self._file_format}"
+        if not self._load_method and not hasattr(pd.DataFrame, self._save_method_name):
+            raise DataSetError(
+                f"Unable to retrieve 'pandas.read_{self._file_format}' or "
+                f"'pandas.DataFrame.to_{self._file_format}' method, please ensure that "
+                "your 'file_format' parameter has been defined correctly as per the "
+                "Pandas API https://pandas.pydata.org/docs/reference/io.html"
+            )
 
-        _fs_args = deepcopy(fs_args) or {}
+        _fs_args = _shallow_config_copy(fs_args or {})
         _fs_open_args_load = _fs_args.pop("open_args_load", {})
         _fs_open_args_save = _fs_args.pop("open_args_save", {})
-        _credentials = deepcopy(credentials) or {}
+        _credentials = _shallow_config_copy(credentials or {})
 
         protocol, path = get_protocol_and_path(filepath)
         if protocol == "file":
             _fs_args.setdefault("auto_mkdir", True)
 
         self._protocol = protocol
+        # `fsspec` shares one instance between datasets with the same arguments
         self._fs = fsspec.filesystem(self._protocol, **_credentials, **_fs_args)
 
         super().__init__(
@@ -161,17 +253,71 @@ class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
             glob_function=self._fs.glob,
         )
 
-        self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
+        # the path never changes when versioning is disabled, so it is resolved once
+        self._filepath_str = get_filepath_str(self._filepath, self._protocol)
+
+        self._load_args = dict(self.DEFAULT_LOAD_ARGS)
         if load_args is not None:
             self._load_args.update(load_args)
-        self._save_args = deepcopy(self.DEFAULT_SAVE_ARGS)
+        self._chunked = False
+        if self._file_format == "parquet":
+            self._chunked = self._load_args.pop("chunked", False)
+            self._batch_size = self._load_args.pop("batch_size", 65536)
+            # without a recent enough `pyarrow`, e.g. with `fastparquet` only,
+            # files are read by pandas
+            self._pyarrow_version = _get_pyarrow_version()
+            self._use_pyarrow = (self._pyarrow_version or (0,)) >= PYARROW_MIN_VERSION
+            if self._chunked and not self._use_pyarrow:
+                raise DataSetError(
+                    "Loading Parquet files in chunks requires 'pyarrow>=3.0'. "
+                    "Please install it with 'pip install \"pyarrow>=3.0\"'."
+                )
+            if self._chunked:
+                self._check_load_args({"columns"}, "loading Parquet files in chunks")
+        elif self._file_format == "csv":
+            if "columns" in self._load_args:
+                if "usecols" in self._load_args:
+                    raise DataSetError(
+                        "Load arguments 'columns' and 'usecols' cannot both be "
+                        "given when loading CSV files."
+                    )
+                self._load_args["usecols"] = self._load_args.pop("columns")
+            self._chunked = (
+                self._load_args.pop("chunked", False) or "chunksize" in self._load_args
+            )
+            if self._chunked:
+                self._load_args.setdefault("chunksize", 100_000)
+        elif self._file_format == "json":
+            self._use_orjson = self._load_args.get("engine") == "orjson"
+            if self._use_orjson:
+                if find_spec("orjson") is None:
+                    raise DataSetError(
+                        "Loading JSON files with the 'orjson' engine requires 'orjson'. "
+                        "Please install it with 'pip install orjson'."
+                    )
+                del self._load_args["engine"]
+                self._check_load_args(
+                    {"lines"}, "loading JSON files with the 'orjson' engine"
+                )
+        self._save_args = dict(self.DEFAULT_SAVE_ARGS)
         if save_args is not None:
             self._save_args.update(save_args)
 
+        if protocol != "file" and self._file_format in COLUMNAR_FORMATS:
+            _fs_open_args_load.setdefault("block_size", REMOTE_COLUMNAR_BUFFER_SIZE)
         _fs_open_args_save.setdefault("mode", "w")
+        self._load_cache = LRUCache(maxsize=int(cache)) if cache else None
         self._fs_open_args_load = _fs_open_args_load
         self._fs_open_args_save = _fs_open_args_save
 
+    def _check_load_args(self, supported_args: Set[str], context: str) -> None:
+        unsupported_args = set(self._load_args) - supported_args
+        if unsupported_args:
+            raise DataSetError(
+                f"Load arguments {sorted(unsupported_args)} are not supported "
+                f"when {context}."
+            )
+
     def _ensure_file_system_target(self) -> None:
         # Fail fast if provided a known non-filesystem target
         if self._file_format in NON_FILE_SYSTEM_TARGETS:
@@ -180,27 +326,147 @@ class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
                 f"does not support a filepath target/source."
             )
 
-    def _load(self) -> pd.DataFrame:
+    def _get_load_path_str(self) -> str:
+        if self._version:
+            return get_filepath_str(self._get_load_path(), self._protocol)
+        return self._filepath_str
+
+    def _load(self) -> "pd.DataFrame":
 
         self._ensure_file_system_target()
 
-        load_path = get_filepath_str(self._get_load_path(), self._protocol)
-        load_method = getattr(pd, f"read_{self._file_format}", None)
-        if load_method:
+        load_path = self._get_load_path_str()
+        if self._load_cache is None:
+            return self._load_from_path(load_path)
+
+        key = (load_path, self._fs.ukey(load_path))
+        data = self._load_cache.get(key)
+        if data is None:
+            # pylint: disable=import-outside-toplevel
+            import pandas as pd
+
+            data = self._load_from_path(load_path)
+            if not isinstance(data, pd.DataFrame):
+                # e.g. chunked loads, which can only be consumed once
+                return data
+            self._load_cache[key] = data
+        return data.copy()
+
+    def _load_from_path(self, load_path: str) -> Any:
+        if self._file_format == "parquet":
+            return self._load_parquet(load_path)
+        if self._file_format == "feather" and self._protocol == "file":
+            return self._load_local_feather(load_path)
+        if self._file_format == "csv" and self._chunked:
+            return self._iter_csv_chunks(load_path)
+        if self._file_format == "json" and self._use_orjson:
+            return self._load_json_with_orjson(load_path)
+
+        if self._load_method:
             with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
-                return load_method(fs_file, **self._load_args)
+                return self._load_method(fs_file, **self._load_args)
         raise DataSetError(
             f"Unable to retrieve 'pandas.read_{self._file_format}' method, please ensure that your "
             "'file_format' parameter has been defined correctly as per the Pandas API "
             "https://pandas.pydata.org/docs/reference/io.html"
         )
 
-    def _save(self, data: pd.DataFrame) -> None:
+    def _iter_csv_chunks(self, load_path: str) -> Iterator["pd.DataFrame"]:
+        # the file has to stay open until all the chunks have been read, but is
+        # opened here so that errors such as a missing file are raised by `load`
+        fs_file = self._fs.open(load_path, **self._fs_open_args_load)
+        try:
+            reader = self._load_method(fs_file, **self._load_args)
+        except Exception:
+            fs_file.close()
+            raise
+        return _iter_and_close(fs_file, reader)
+
+    def _load_json_with_orjson(self, load_path: str) -> "pd.DataFrame":
+        # pylint: disable=import-outside-toplevel,no-member
+        import orjson
+        import pandas as pd
+
+        with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
+            content = fs_file.read()
+
+        if self._load_args.get("lines"):
+            return pd.DataFrame.from_records(
+                [orjson.loads(line) for line in content.splitlines() if line.strip()]
+            )
+        data = orjson.loads(content)
+        if isinstance(data, list):
+            return pd.DataFrame.from_records(data)
+        return pd.DataFrame(data)
+
+    def _load_local_feather(self, load_path: str) -> "pd.DataFrame":
+        # pylint: disable=import-outside-toplevel
+        from pyarrow import feather
+
+        use_threads = self._load_args.get("use_threads", True)
+        table = feather.read_table(
+            load_path,
+            columns=self._load_args.get("columns"),
+            memory_map=True,
+            use_threads=use_threads,
+        )
+        return table.to_pandas(**{**ARROW_TO_PANDAS_ARGS, "use_threads": use_threads})
+
+    def _open_parquet_file(self, fs_file: Any) -> Any:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet as pq
+
+        if (
+            self._protocol == "file"
+            or self._pyarrow_version < PYARROW_PRE_BUFFER_MIN_VERSION
+        ):
+            return pq.ParquetFile(fs_file)
+        return pq.ParquetFile(
+            fs_file, buffer_size=REMOTE_COLUMNAR_BUFFER_SIZE, pre_buffer=True
+        )
+
+    def _load_parquet(self, load_path: str) -> Any:
+        if self._chunked:
+            return self._iter_parquet_batches(load_path)
+
+        with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
+            if not self._use_pyarrow or set(self._load_args) - {"columns"}:
+                # pandas-specific options (e.g. `engine`) need the generic reader
+                return self._load_method(fs_file, **self._load_args)
+            parquet_file = self._open_parquet_file(fs_file)
+            table = parquet_file.read(
+                columns=self._load_args.get("columns"),
+                use_threads=True,
+                use_pandas_metadata=True,
+            )
+            return table.to_pandas(**ARROW_TO_PANDAS_ARGS)
+
+    def _iter_parquet_batches(self, load_path: str) -> Iterator["pd.DataFrame"]:
+        # the file is opened here rather than on first iteration, so that errors
+        # such as a missing file are raised by `load`
+        fs_file = self._fs.open(load_path, **self._fs_open_args_load)
+        try:
+            batches = self._open_parquet_file(fs_file).iter_batches(
+                batch_size=self._batch_size,
+                columns=self._load_args.get("columns"),
+                use_pandas_metadata=True,
+            )
+        except Exception:
+            fs_file.close()
+            raise
+        return _iter_and_close(
+            fs_file, (batch.to_pandas(**ARROW_TO_PANDAS_ARGS) for batch in batches)
+        )
+
+    def _save(self, data: "pd.DataFrame") -> None:
 
         self._ensure_file_system_target()
 
-        save_path = get_filepath_str(self._get_save_path(), self._protocol)
-        save_method = getattr(data, f"to_{self._file_format}", None)
+        if self._version:
+            save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        else:
+            save_path = self._filepath_str
+        save_method = getattr(data, self._save_method_name, None)
         if save_method:
             with self._fs.open(save_path, **self._fs_open_args_save) as fs_file:
                 # KEY ASSUMPTION - first argument is path/buffer/io
@@ -216,7 +482,7 @@ class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
 
     def _exists(self) -> bool:
         try:
-            load_path = get_filepath_str(self._get_load_path(), self._protocol)
+            load_path = self._get_load_path_str()
         except DataSetError:
             return False
 
@@ -237,6 +503,9 @@ class GenericDataSet(AbstractVersionedDataSet[pd.DataFrame, pd.DataFrame]):
         self._invalidate_cache()
 
     def _invalidate_cache(self) -> None:
-        """Invalidate underlying filesystem caches."""
-        filepath = get_filepath_str(self._filepath, self._protocol)
-        self._fs.invalidate_cache(filepath)
+        """Invalidate underlying filesystem caches and cached DataFrames."""
+        # the local filesystem does not cache listings, so there is nothing to invalidate
+        if self._protocol != "file":
+            self._fs.invalidate_cache(self._filepath_str)
+        if self._load_cache is not None:
+            self._load_cache.clear()
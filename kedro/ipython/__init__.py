@@ -4,7 +4,9 @@ This script creates an IPython extension to load Kedro-related variables in
 local scope.
 """
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -12,33 +14,109 @@ from IPython import get_ipython
 from IPython.core.magic import needs_local_scope, register_line_magic
 from IPython.core.magic_arguments import argument, magic_arguments, parse_argstring
 
-from kedro.framework.cli import load_entry_points
 from kedro.framework.cli.project import PARAMS_ARG_HELP
-from kedro.framework.cli.utils import ENV_HELP, _split_params
+from kedro.framework.cli.utils import (
+    ENV_HELP,
+    _get_entry_points,
+    _safe_load_entry_point,
+    _split_params,
+)
 from kedro.framework.project import LOGGING  # noqa
 from kedro.framework.project import configure_project, pipelines
 from kedro.framework.session import KedroSession
-from kedro.framework.startup import _is_project, bootstrap_project
+from kedro.framework.startup import (
+    ProjectMetadata,
+    _add_src_to_path,
+    _get_project_metadata,
+    _is_project,
+)
 
 logger = logging.getLogger(__name__)
 default_project_path = Path.cwd()
 
 
-def _remove_cached_modules(package_name):  # pragma: no cover
-    to_remove = [mod for mod in sys.modules if mod.startswith(package_name)]
-    # `del` is used instead of `reload()` because: If the new version of a module does not
-    # define a name that was defined by the old version, the old definition remains.
-    for module in to_remove:
-        del sys.modules[module]
-
-
-def _find_kedro_project(current_dir: Path):  # pragma: no cover
-    while current_dir != current_dir.parent:
-        if _is_project(current_dir):
-            return current_dir
-        current_dir = current_dir.parent
-
-    return None
+class _LazyLineMagic:
+    """Line magic registered from a ``kedro.line_magic`` entry point, which only
+    imports the entry point the first time the magic is used."""
+
+    def __init__(self, entry_point):
+        self._entry_point = entry_point
+        self._line_magic = None
+        # the name of the function the entry point refers to, which is what the
+        # magic would be registered as once loaded
+        if entry_point.attr:
+            self.__name__ = entry_point.attr.rsplit(".", 1)[-1]
+        else:
+            self.__name__ = entry_point.name
+
+    @property  # type: ignore
+    def __doc__(self):
+        # IPython shows the docstring of the registered object as the magic's help
+        line_magic = self._load()
+        return line_magic.__doc__ if line_magic else None
+
+    def _load(self):
+        if self._line_magic is None:
+            # like other plugins, a magic that fails to load is skipped with a warning
+            self._line_magic = _safe_load_entry_point(self._entry_point)
+        return self._line_magic
+
+    def __call__(self, line: str, local_ns: Dict[str, Any] = None):
+        line_magic = self._load()
+        if line_magic is None:
+            return None
+        return line_magic(line, local_ns=local_ns)
+
+
+def _remove_cached_modules(package_name):
+    # match the package and its submodules only, not other packages sharing its prefix
+    submodule_prefix = package_name + "."
+    modules = sys.modules
+    remove = modules.pop
+    # Removing is used instead of `reload()` because: If the new version of a module does
+    # not define a name that was defined by the old version, the old definition remains.
+    for module in [
+        mod
+        for mod in list(modules)
+        if mod == package_name or mod.startswith(submodule_prefix)
+    ]:
+        remove(module, None)
+
+
+def _find_kedro_project(current_dir: Path):
+    # walk up the directory tree as strings, only creating a `Path` for each check
+    path = str(current_dir.resolve())
+    while True:
+        if _is_project(path):
+            return Path(path)
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+@lru_cache(maxsize=8)
+def _cached_project_metadata(
+    project_path: Path, pyproject_mtime: float  # pylint: disable=unused-argument
+) -> ProjectMetadata:
+    # `pyproject_mtime` is only part of the cache key, so that editing
+    # `pyproject.toml` reads the project metadata again
+    return _get_project_metadata(project_path)
+
+
+def _bootstrap_project(project_path: Path) -> ProjectMetadata:
+    """Bootstrap the project like ``bootstrap_project``, reusing the metadata read
+    for the same project as long as its ``pyproject.toml`` has not been modified."""
+    try:
+        pyproject_mtime = (Path(project_path) / "pyproject.toml").stat().st_mtime
+    except OSError:
+        # let `_get_project_metadata` raise its more descriptive error
+        metadata = _get_project_metadata(project_path)
+    else:
+        metadata = _cached_project_metadata(project_path, pyproject_mtime)
+    _add_src_to_path(metadata.source_dir, project_path)
+    configure_project(metadata.package_name)
+    return metadata
 
 
 def reload_kedro(
@@ -55,7 +133,7 @@ def reload_kedro(
     else:
         logger.info("No path argument was provided. Using: %s", default_project_path)
 
-    metadata = bootstrap_project(default_project_path)
+    metadata = _bootstrap_project(default_project_path)
     _remove_cached_modules(metadata.package_name)
     configure_project(metadata.package_name)
 
@@ -79,9 +157,10 @@ def reload_kedro(
         "Defined global variable 'context', 'session', 'catalog' and 'pipelines'"
     )
 
-    for line_magic in load_entry_points("line_magic"):
+    for entry_point in _get_entry_points("line_magic"):
+        line_magic = _LazyLineMagic(entry_point)
         register_line_magic(needs_local_scope(line_magic))
-        logger.info("Registered line magic '%s'", line_magic.__name__)  # type: ignore
+        logger.info("Registered line magic '%s'", line_magic.__name__)
 
 
 @magic_arguments()
@@ -8,7 +8,12 @@ import pytest
 import yaml
 from yaml.parser import ParserError
 
-from kedro.config import BadConfigException, ConfigLoader, MissingConfigException
+from kedro.config import (
+    AbstractConfigLoader,
+    BadConfigException,
+    ConfigLoader,
+    MissingConfigException,
+)
 
 _DEFAULT_RUN_ENV = "local"
 _BASE_ENV = "base"
@@ -332,3 +337,22 @@ class TestConfigLoader:
         msg = f"Invalid YAML file {conf_path / 'catalog.yml'}, unable to read line 3, position 10."
         with pytest.raises(ParserError, match=re.escape(msg)):
             ConfigLoader(str(tmp_path)).get("catalog*.yml")
+
+    def test_dict_interface(self, tmp_path):
+        """Check that the config loader is a dict whose legacy ``data`` attribute
+        refers to the loader itself."""
+        conf = ConfigLoader(str(tmp_path))
+        assert isinstance(conf, dict)
+        assert conf.data is conf
+
+        conf.data = {"key": "value"}
+        assert dict(conf) == {"key": "value"}
+
+    def test_abstract_config_loader_slots(self, tmp_path):
+        conf = AbstractConfigLoader(str(tmp_path), env="local")
+        assert not hasattr(conf, "__dict__")
+        assert (conf.conf_source, conf.env, conf.runtime_params) == (
+            str(tmp_path),
+            "local",
+            None,
+        )
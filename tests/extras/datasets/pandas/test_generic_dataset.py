@@ -1,16 +1,20 @@
 from pathlib import Path, PurePosixPath
 from time import sleep
 
+import importlib_metadata
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from adlfs import AzureBlobFileSystem
 from fsspec.implementations.http import HTTPFileSystem
 from fsspec.implementations.local import LocalFileSystem
 from gcsfs import GCSFileSystem
 from pandas._testing import assert_frame_equal
+from pyarrow import feather
 from s3fs import S3FileSystem
 
 from kedro.extras.datasets.pandas import GenericDataSet
+from kedro.extras.datasets.pandas.generic_dataset import REMOTE_COLUMNAR_BUFFER_SIZE
 from kedro.io import DataSetError, Version
 from kedro.io.core import PROTOCOL_DELIMITER, generate_timestamp
 
@@ -30,6 +34,16 @@ def filepath_html(tmp_path):
     return tmp_path / "test.html"
 
 
+@pytest.fixture
+def filepath_feather(tmp_path):
+    return tmp_path / "test.feather"
+
+
+@pytest.fixture
+def filepath_parquet(tmp_path):
+    return tmp_path / "test.parquet"
+
+
 # pylint: disable = line-too-long
 @pytest.fixture()
 def sas_binary():
@@ -85,6 +99,26 @@ def csv_data_set(filepath_csv):
     )
 
 
+@pytest.fixture
+def feather_data_set(filepath_feather, load_args):
+    return GenericDataSet(
+        filepath=filepath_feather.as_posix(),
+        file_format="feather",
+        load_args=load_args,
+        fs_args={"open_args_save": {"mode": "wb"}},
+    )
+
+
+@pytest.fixture
+def parquet_data_set(filepath_parquet, load_args):
+    return GenericDataSet(
+        filepath=filepath_parquet.as_posix(),
+        file_format="parquet",
+        load_args=load_args,
+        fs_args={"open_args_save": {"mode": "wb"}},
+    )
+
+
 @pytest.fixture
 def dummy_dataframe():
     return pd.DataFrame({"col1": [1, 2], "col2": [4, 5], "col3": [5, 6]})
@@ -139,15 +173,56 @@ class TestGenericSasDataSet:
         assert str(data_set._filepath) == path
         assert isinstance(data_set._filepath, PurePosixPath)
 
+    def test_filesystem_shared(self):
+        """Test that datasets created with the same filesystem arguments share the
+        filesystem instance."""
+        fs_args = {"anon": True}
+        data_set_a = GenericDataSet("s3://bucket/a.sas7bdat", "sas", fs_args=fs_args)
+        data_set_b = GenericDataSet("s3://bucket/b.sas7bdat", "sas", fs_args=fs_args)
+        assert data_set_a._fs is data_set_b._fs
+
+    def test_filesystem_instance_cache_cleared(self):
+        """Test that clearing the ``fsspec`` instance cache gives new datasets a
+        new filesystem instance."""
+        fs_args = {"anon": True}
+        data_set_a = GenericDataSet("s3://bucket/a.sas7bdat", "sas", fs_args=fs_args)
+        S3FileSystem.clear_instance_cache()
+        data_set_b = GenericDataSet("s3://bucket/b.sas7bdat", "sas", fs_args=fs_args)
+        assert data_set_a._fs is not data_set_b._fs
+
+    def test_arguments_not_mutated(self, filepath_sas):
+        """Test that the dataset does not modify the arguments it was given."""
+        fs_args = {"open_args_load": {"encoding": "utf-8"}, "open_args_save": {}}
+        credentials = {"client_kwargs": {}}
+        GenericDataSet(
+            filepath=filepath_sas.as_posix(),
+            file_format="sas",
+            fs_args=fs_args,
+            credentials=credentials,
+        )
+        assert fs_args == {
+            "open_args_load": {"encoding": "utf-8"},
+            "open_args_save": {},
+        }
+        assert credentials == {"client_kwargs": {}}
+
     def test_catalog_release(self, mocker):
         fs_mock = mocker.patch("fsspec.filesystem").return_value
-        filepath = "test.csv"
+        filepath = "s3://bucket/test.csv"
         data_set = GenericDataSet(filepath=filepath, file_format="sas")
         assert data_set._version_cache.currsize == 0  # no cache if unversioned
         data_set.release()
-        fs_mock.invalidate_cache.assert_called_once_with(filepath)
+        fs_mock.invalidate_cache.assert_called_once_with("bucket/test.csv")
         assert data_set._version_cache.currsize == 0
 
+    def test_catalog_release_local(self, mocker):
+        """Test that the local filesystem, which keeps no listings cache, is not
+        asked to invalidate it."""
+        fs_mock = mocker.patch("fsspec.filesystem").return_value
+        data_set = GenericDataSet(filepath="test.csv", file_format="sas")
+        data_set.release()
+        fs_mock.invalidate_cache.assert_not_called()
+
 
 class TestGenericCSVDataSetVersioned:
     def test_version_str_repr(self, filepath_csv, load_version, save_version):
@@ -329,6 +404,126 @@ class TestGenericCSVDataSetVersioned:
         assert versioned_csv_data_set.exists()
 
 
+class TestGenericCSVDataSet:
+    @pytest.fixture
+    def csv_data_set_with_args(self, filepath_csv, load_args):
+        return GenericDataSet(
+            filepath=filepath_csv.as_posix(),
+            file_format="csv",
+            load_args=load_args,
+            save_args={"index": False},
+        )
+
+    @pytest.mark.parametrize(
+        "load_args", [{"columns": ["col1", "col3"]}], indirect=True
+    )
+    def test_load_columns(self, dummy_dataframe, csv_data_set_with_args):
+        """Test that `columns` selects the columns to read like `usecols`."""
+        csv_data_set_with_args.save(dummy_dataframe)
+        assert csv_data_set_with_args._load_args == {"usecols": ["col1", "col3"]}
+        df = csv_data_set_with_args.load()
+        assert_frame_equal(dummy_dataframe[["col1", "col3"]], df)
+
+    def test_columns_and_usecols(self, filepath_csv):
+        pattern = (
+            r"Load arguments 'columns' and 'usecols' cannot both be given when "
+            r"loading CSV files."
+        )
+        with pytest.raises(DataSetError, match=pattern):
+            GenericDataSet(
+                filepath=filepath_csv.as_posix(),
+                file_format="csv",
+                load_args={"columns": ["col1"], "usecols": ["col2"]},
+            )
+
+    @pytest.mark.parametrize(
+        "load_args,expected_chunks",
+        [({"chunked": True}, 1), ({"chunked": True, "chunksize": 1}, 2)],
+        indirect=["load_args"],
+    )
+    def test_load_chunked(
+        self, dummy_dataframe, csv_data_set_with_args, expected_chunks
+    ):
+        csv_data_set_with_args.save(dummy_dataframe)
+        chunks = list(csv_data_set_with_args.load())
+        assert len(chunks) == expected_chunks
+        assert_frame_equal(dummy_dataframe, pd.concat(chunks))
+
+    @pytest.mark.parametrize("load_args", [{"chunked": True}], indirect=True)
+    def test_load_chunked_missing_file(self, csv_data_set_with_args):
+        """Test that a missing file is reported by `load` rather than on iteration."""
+        pattern = r"Failed while loading data from data set GenericDataSet\(.*\)"
+        with pytest.raises(DataSetError, match=pattern):
+            csv_data_set_with_args.load()
+
+    @pytest.mark.parametrize("load_args", [{"chunksize": 1}], indirect=True)
+    def test_load_chunksize(self, dummy_dataframe, csv_data_set_with_args):
+        """Test that passing a `chunksize` also loads the file in chunks."""
+        csv_data_set_with_args.save(dummy_dataframe)
+        chunks = list(csv_data_set_with_args.load())
+        assert [len(chunk) for chunk in chunks] == [1, 1]
+
+
+class TestGenericJSONDataSet:
+    @pytest.fixture
+    def filepath_json(self, tmp_path):
+        return tmp_path / "test.json"
+
+    @pytest.mark.parametrize(
+        "save_args,load_args",
+        [
+            ({"orient": "records"}, {"engine": "orjson"}),
+            ({"orient": "records", "lines": True}, {"engine": "orjson", "lines": True}),
+        ],
+    )
+    def test_load_orjson(self, filepath_json, dummy_dataframe, save_args, load_args):
+        data_set = GenericDataSet(
+            filepath=filepath_json.as_posix(),
+            file_format="json",
+            load_args=load_args,
+            save_args=save_args,
+        )
+        data_set.save(dummy_dataframe)
+        assert_frame_equal(dummy_dataframe, data_set.load())
+
+    def test_load_orjson_columns(self, filepath_json, dummy_dataframe):
+        """Test that column-oriented files keep the JSON object keys as index."""
+        data_set = GenericDataSet(
+            filepath=filepath_json.as_posix(),
+            file_format="json",
+            load_args={"engine": "orjson"},
+            save_args={"orient": "columns"},
+        )
+        data_set.save(dummy_dataframe)
+        assert_frame_equal(
+            dummy_dataframe.set_axis(["0", "1"], axis="index"), data_set.load()
+        )
+
+    def test_orjson_not_installed(self, filepath_json, mocker):
+        mocker.patch(
+            "kedro.extras.datasets.pandas.generic_dataset.find_spec", return_value=None
+        )
+        pattern = r"Loading JSON files with the 'orjson' engine requires 'orjson'"
+        with pytest.raises(DataSetError, match=pattern):
+            GenericDataSet(
+                filepath=filepath_json.as_posix(),
+                file_format="json",
+                load_args={"engine": "orjson"},
+            )
+
+    def test_orjson_unsupported_load_args(self, filepath_json):
+        pattern = (
+            r"Load arguments \['dtype'\] are not supported when loading JSON files "
+            r"with the 'orjson' engine."
+        )
+        with pytest.raises(DataSetError, match=pattern):
+            GenericDataSet(
+                filepath=filepath_json.as_posix(),
+                file_format="json",
+                load_args={"engine": "orjson", "dtype": False},
+            )
+
+
 class TestGenericHtmlDataSet:
     def test_save_and_load(self, dummy_dataframe, html_data_set):
         html_data_set.save(dummy_dataframe)
@@ -336,26 +531,286 @@ class TestGenericHtmlDataSet:
         assert_frame_equal(dummy_dataframe, df[0])
 
 
+class TestGenericFeatherDataSet:
+    def test_save_and_load(self, dummy_dataframe, feather_data_set):
+        feather_data_set.save(dummy_dataframe)
+        df = feather_data_set.load()
+        assert_frame_equal(dummy_dataframe, df)
+
+    def test_loaded_data_writable(self, dummy_dataframe, feather_data_set):
+        """Test that the memory-mapped DataFrame can be modified in place."""
+        feather_data_set.save(dummy_dataframe)
+        df = feather_data_set.load()
+        df.iloc[0, 0] = 10
+        df["col2"].fillna(0, inplace=True)
+        df.values[1, 2] = 20
+        assert df["col1"].tolist() == [10, 2]
+
+    @pytest.mark.parametrize("load_args", [{"columns": ["col3"]}], indirect=True)
+    def test_load_memory_mapped(self, dummy_dataframe, feather_data_set, mocker):
+        """Test that local Feather files are memory-mapped and only the requested
+        columns are read."""
+        feather_data_set.save(dummy_dataframe)
+        read_table = mocker.spy(feather, "read_table")
+
+        df = feather_data_set.load()
+        assert_frame_equal(dummy_dataframe[["col3"]], df)
+        assert read_table.call_args[1]["memory_map"]
+        assert read_table.call_args[1]["columns"] == ["col3"]
+
+
+class TestGenericParquetDataSet:
+    def test_save_and_load(self, dummy_dataframe, parquet_data_set):
+        parquet_data_set.save(dummy_dataframe)
+        df = parquet_data_set.load()
+        assert_frame_equal(dummy_dataframe, df)
+
+    @pytest.mark.parametrize("load_args", [{}, {"chunked": True}], indirect=True)
+    def test_loaded_data_writable(self, dummy_dataframe, parquet_data_set):
+        """Test that loaded DataFrames can be modified in place."""
+        parquet_data_set.save(dummy_dataframe)
+        df = parquet_data_set.load()
+        if not isinstance(df, pd.DataFrame):
+            df = next(df)
+        df.iloc[0, 0] = 10
+        df.loc[1, "col2"] = 20
+        df["col3"].fillna(0, inplace=True)
+        df.values[1, 2] = 30
+        assert df["col1"].tolist() == [10, 2]
+
+    @pytest.mark.parametrize(
+        "load_args", [{"columns": ["col1", "col3"]}], indirect=True
+    )
+    def test_load_columns(self, dummy_dataframe, parquet_data_set):
+        """Test that only the requested columns are loaded."""
+        parquet_data_set.save(dummy_dataframe)
+        df = parquet_data_set.load()
+        assert_frame_equal(dummy_dataframe[["col1", "col3"]], df)
+
+    @pytest.mark.parametrize(
+        "load_args",
+        [{"columns": ["col1"]}, {"columns": ["col1"], "chunked": True}],
+        indirect=True,
+    )
+    def test_load_columns_keeps_index(self, parquet_data_set):
+        """Test that the saved index is restored when selecting columns."""
+        data = pd.DataFrame({"col1": range(5), "col2": range(5)}, index=list("vwxyz"))
+        parquet_data_set.save(data)
+        df = parquet_data_set.load()
+        if not isinstance(df, pd.DataFrame):
+            df = pd.concat(df)
+        assert_frame_equal(data[["col1"]], df)
+
+    @pytest.mark.parametrize(
+        "load_args",
+        [{"chunked": True, "batch_size": 1, "columns": ["col2"]}],
+        indirect=True,
+    )
+    def test_load_chunked(self, dummy_dataframe, parquet_data_set):
+        """Test that chunked loading yields DataFrames of `batch_size` rows."""
+        parquet_data_set.save(dummy_dataframe)
+        chunks = list(parquet_data_set.load())
+        assert len(chunks) == 2
+        assert all(len(chunk) == 1 for chunk in chunks)
+        assert_frame_equal(
+            dummy_dataframe[["col2"]], pd.concat(chunks, ignore_index=True)
+        )
+        assert "chunked" not in parquet_data_set._load_args
+
+    @pytest.mark.parametrize("load_args", [{"chunked": True}], indirect=True)
+    def test_load_chunked_missing_file(self, parquet_data_set):
+        """Test that a missing file is reported by `load` rather than on iteration."""
+        pattern = r"Failed while loading data from data set GenericDataSet\(.*\)"
+        with pytest.raises(DataSetError, match=pattern):
+            parquet_data_set.load()
+
+    @pytest.fixture(params=["missing", "2.0.0"])
+    def unsupported_pyarrow(self, request, mocker):
+        """Mock a missing or too old ``pyarrow`` installation."""
+        version = mocker.patch(
+            "kedro.extras.datasets.pandas.generic_dataset.importlib_metadata.version"
+        )
+        if request.param == "missing":
+            version.side_effect = importlib_metadata.PackageNotFoundError("pyarrow")
+        else:
+            version.return_value = request.param
+
+    @pytest.mark.usefixtures("unsupported_pyarrow")
+    def test_load_without_pyarrow(self, dummy_dataframe, filepath_parquet, mocker):
+        """Test that files are read with pandas when `pyarrow` is not installed or
+        too old."""
+        data_set = GenericDataSet(
+            filepath=filepath_parquet.as_posix(),
+            file_format="parquet",
+            load_args={"columns": ["col1"]},
+            fs_args={"open_args_save": {"mode": "wb"}},
+        )
+        data_set.save(dummy_dataframe)
+        read_parquet = mocker.spy(data_set, "_load_method")
+        parquet_file = mocker.spy(pq, "ParquetFile")
+
+        assert_frame_equal(dummy_dataframe[["col1"]], data_set.load())
+        read_parquet.assert_called_once_with(mocker.ANY, columns=["col1"])
+        parquet_file.assert_not_called()
+
+    @pytest.mark.usefixtures("unsupported_pyarrow")
+    def test_chunked_without_pyarrow(self, filepath_parquet):
+        pattern = r"Loading Parquet files in chunks requires 'pyarrow>=3.0'"
+        with pytest.raises(DataSetError, match=pattern):
+            GenericDataSet(
+                filepath=filepath_parquet.as_posix(),
+                file_format="parquet",
+                load_args={"chunked": True},
+            )
+
+    def test_chunked_unsupported_load_args(self, filepath_parquet):
+        pattern = (
+            r"Load arguments \['filters'\] are not supported when loading Parquet "
+            r"files in chunks."
+        )
+        with pytest.raises(DataSetError, match=pattern):
+            GenericDataSet(
+                filepath=filepath_parquet.as_posix(),
+                file_format="parquet",
+                load_args={"chunked": True, "filters": [("col1", ">", 1)]},
+            )
+
+    def test_load_remote_pre_buffered(self, dummy_dataframe, mocker):
+        """Test that Parquet files on remote filesystems are read with coalesced,
+        buffered reads."""
+        data_set = GenericDataSet(
+            filepath="memory://bucket/test.parquet",
+            file_format="parquet",
+            fs_args={"open_args_save": {"mode": "wb"}},
+        )
+        data_set.save(dummy_dataframe)
+        parquet_file = mocker.spy(pq, "ParquetFile")
+
+        assert_frame_equal(dummy_dataframe, data_set.load())
+        parquet_file.assert_called_once_with(
+            mocker.ANY, buffer_size=REMOTE_COLUMNAR_BUFFER_SIZE, pre_buffer=True
+        )
+        data_set._fs.rm("bucket/test.parquet")
+
+    def test_load_remote_old_pyarrow(self, dummy_dataframe, mocker):
+        """Test that remote Parquet files are not pre-buffered with a `pyarrow`
+        version which does not support it."""
+        mocker.patch(
+            "kedro.extras.datasets.pandas.generic_dataset.importlib_metadata.version",
+            return_value="4.0.1",
+        )
+        data_set = GenericDataSet(
+            filepath="memory://bucket/test.parquet",
+            file_format="parquet",
+            fs_args={"open_args_save": {"mode": "wb"}},
+        )
+        data_set.save(dummy_dataframe)
+        parquet_file = mocker.spy(pq, "ParquetFile")
+
+        assert_frame_equal(dummy_dataframe, data_set.load())
+        parquet_file.assert_called_once_with(mocker.ANY)
+        data_set._fs.rm("bucket/test.parquet")
+
+    @pytest.mark.parametrize(
+        "filepath,fs_args,expected_open_args_load",
+        [
+            ("s3://bucket/test.parquet", None, {"block_size": 256 * 1024}),
+            (
+                "s3://bucket/test.parquet",
+                {"open_args_load": {"block_size": 1024}},
+                {"block_size": 1024},
+            ),
+            ("/tmp/test.parquet", None, {}),
+        ],
+    )
+    def test_remote_block_size(self, filepath, fs_args, expected_open_args_load):
+        """Test the default block size used to open remote columnar files."""
+        data_set = GenericDataSet(
+            filepath=filepath, file_format="parquet", fs_args=fs_args
+        )
+        assert data_set._fs_open_args_load == expected_open_args_load
+
+
+class TestGenericDataSetLoadCache:
+    @pytest.fixture
+    def cached_csv_data_set(self, filepath_csv):
+        return GenericDataSet(
+            filepath=filepath_csv.as_posix(),
+            file_format="csv",
+            save_args={"index": False},
+            cache=True,
+        )
+
+    def test_load_cached(self, cached_csv_data_set, dummy_dataframe, mocker):
+        """Test that an unchanged file is only read once and that a copy of the
+        cached DataFrame is returned."""
+        cached_csv_data_set.save(dummy_dataframe)
+        read_csv = mocker.spy(cached_csv_data_set, "_load_method")
+
+        first = cached_csv_data_set.load()
+        first["col1"] = 0
+        second = cached_csv_data_set.load()
+
+        assert read_csv.call_count == 1
+        assert_frame_equal(dummy_dataframe, second)
+
+    def test_load_modified_file(self, cached_csv_data_set, dummy_dataframe):
+        """Test that a file modified by an external system is read again."""
+        cached_csv_data_set.save(dummy_dataframe)
+        cached_csv_data_set.load()
+
+        sleep(0.5)
+        new_dataframe = dummy_dataframe.head(1)
+        new_dataframe.to_csv(cached_csv_data_set._filepath, index=False)
+        assert_frame_equal(new_dataframe, cached_csv_data_set.load())
+
+    def test_release(self, cached_csv_data_set, dummy_dataframe):
+        cached_csv_data_set.save(dummy_dataframe)
+        cached_csv_data_set.load()
+        assert cached_csv_data_set._load_cache.currsize == 1
+        cached_csv_data_set.release()
+        assert cached_csv_data_set._load_cache.currsize == 0
+
+    def test_no_cache_by_default(self, csv_data_set, dummy_dataframe):
+        csv_data_set.save(dummy_dataframe)
+        assert csv_data_set.load() is not csv_data_set.load()
+        assert csv_data_set._load_cache is None
+
+
 class TestBadGenericDataSet:
     def test_bad_file_format_argument(self):
-        ds = GenericDataSet(filepath="test.kedro", file_format="kedro")
+        pattern = (
+            "Unable to retrieve 'pandas.read_kedro' or 'pandas.DataFrame.to_kedro' "
+            "method, please ensure that your 'file_format' parameter has been defined "
+            "correctly as per the Pandas API "
+            "https://pandas.pydata.org/docs/reference/io.html"
+        )
+        with pytest.raises(DataSetError, match=pattern):
+            GenericDataSet(filepath="test.kedro", file_format="kedro")
+
+    def test_missing_load_method(self):
+        """Test that a format which can only be saved raises on load."""
+        ds = GenericDataSet(filepath="test.kedro", file_format="latex")
 
         pattern = (
-            "Unable to retrieve 'pandas.read_kedro' method, please ensure that your 'file_format' "
+            "Unable to retrieve 'pandas.read_latex' method, please ensure that your 'file_format' "
             "parameter has been defined correctly as per the Pandas API "
             "https://pandas.pydata.org/docs/reference/io.html"
         )
-
         with pytest.raises(DataSetError, match=pattern):
             _ = ds.load()
 
-        pattern2 = (
-            "Unable to retrieve 'pandas.DataFrame.to_kedro' method, please ensure that your 'file_format' "
-            "parameter has been defined correctly as per the Pandas API "
+    def test_missing_save_method(self, dummy_dataframe):
+        """Test that a format which can only be loaded raises on save."""
+        ds = GenericDataSet(filepath="test.sas7bdat", file_format="sas")
+
+        pattern = (
+            "Unable to retrieve 'pandas.DataFrame.to_sas' method, please ensure that your "
+            "'file_format' parameter has been defined correctly as per the Pandas API "
             "https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html"
         )
-        with pytest.raises(DataSetError, match=pattern2):
-            ds.save(pd.DataFrame([1]))
+        with pytest.raises(DataSetError, match=pattern):
+            ds.save(dummy_dataframe)
 
     @pytest.mark.parametrize(
         "file_format",
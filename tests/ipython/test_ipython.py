@@ -1,10 +1,22 @@
 # pylint: disable=import-outside-toplevel,reimported
+import os
+import sys
+
 import pytest
 from IPython.core.error import UsageError
+from IPython.core.magic import needs_local_scope
 from IPython.testing.globalipapp import get_ipython
 
 from kedro.framework.startup import ProjectMetadata
-from kedro.ipython import load_ipython_extension, reload_kedro
+from kedro.ipython import (
+    _bootstrap_project,
+    _cached_project_metadata,
+    _find_kedro_project,
+    _LazyLineMagic,
+    _remove_cached_modules,
+    load_ipython_extension,
+    reload_kedro,
+)
 from kedro.pipeline import Pipeline
 
 
@@ -63,10 +75,9 @@ class TestLoadKedroObjects:
             return_value=my_register_pipeline,
         )
         mocker.patch("kedro.framework.startup.configure_project")
-        mocker.patch("kedro.ipython.bootstrap_project", return_value=fake_metadata)
-        mock_line_magic = mocker.Mock()
-        mock_line_magic.__name__ = "abc"
-        mocker.patch("kedro.ipython.load_entry_points", return_value=[mock_line_magic])
+        mocker.patch("kedro.ipython._bootstrap_project", return_value=fake_metadata)
+        mock_entry_point = mocker.Mock(attr="abc")
+        mocker.patch("kedro.ipython._get_entry_points", return_value=[mock_entry_point])
         mock_register_line_magic = mocker.patch("kedro.ipython.register_line_magic")
         mock_session_create = mocker.patch("kedro.ipython.KedroSession.create")
         mock_ipython = mocker.patch("kedro.ipython.get_ipython")
@@ -116,10 +127,9 @@ class TestLoadKedroObjects:
             return_value=my_register_pipeline,
         )
         mocker.patch("kedro.ipython.configure_project")
-        mocker.patch("kedro.ipython.bootstrap_project", return_value=fake_metadata)
-        mock_line_magic = mocker.Mock()
-        mock_line_magic.__name__ = "abc"
-        mocker.patch("kedro.ipython.load_entry_points", return_value=[mock_line_magic])
+        mocker.patch("kedro.ipython._bootstrap_project", return_value=fake_metadata)
+        mock_entry_point = mocker.Mock(attr="abc")
+        mocker.patch("kedro.ipython._get_entry_points", return_value=[mock_entry_point])
         mock_register_line_magic = mocker.patch("kedro.ipython.register_line_magic")
         mock_session_create = mocker.patch("kedro.ipython.KedroSession.create")
         mock_ipython = mocker.patch("kedro.ipython.get_ipython")
@@ -166,10 +176,9 @@ class TestLoadKedroObjects:
         )
 
         mocker.patch("kedro.ipython.configure_project")
-        mocker.patch("kedro.ipython.bootstrap_project", return_value=fake_metadata)
-        mock_line_magic = mocker.Mock()
-        mock_line_magic.__name__ = "abc"
-        mocker.patch("kedro.ipython.load_entry_points", return_value=[mock_line_magic])
+        mocker.patch("kedro.ipython._bootstrap_project", return_value=fake_metadata)
+        mock_entry_point = mocker.Mock(attr="abc")
+        mocker.patch("kedro.ipython._get_entry_points", return_value=[mock_entry_point])
         mocker.patch("kedro.ipython.register_line_magic")
         mocker.patch("kedro.ipython.KedroSession.create")
         mocker.patch("kedro.ipython.get_ipython")
@@ -186,6 +195,141 @@ class TestLoadKedroObjects:
         assert default_project_path == tmp_path
 
 
+def test_remove_cached_modules(mocker):
+    fake_modules = {
+        PACKAGE_NAME: mocker.Mock(),
+        f"{PACKAGE_NAME}.pipelines": mocker.Mock(),
+        f"{PACKAGE_NAME}_extra": mocker.Mock(),
+    }
+    mocker.patch.dict(sys.modules, fake_modules)
+
+    _remove_cached_modules(PACKAGE_NAME)
+
+    assert PACKAGE_NAME not in sys.modules
+    assert f"{PACKAGE_NAME}.pipelines" not in sys.modules
+    # packages merely sharing the prefix are kept
+    assert f"{PACKAGE_NAME}_extra" in sys.modules
+
+
+def test_find_kedro_project(tmp_path):
+    project_path = tmp_path / "project"
+    nested_dir = project_path / "notebooks" / "exploration"
+    nested_dir.mkdir(parents=True)
+
+    assert _find_kedro_project(nested_dir) is None
+
+    (project_path / "pyproject.toml").write_text("[tool.kedro]\n")
+    assert _find_kedro_project(nested_dir) == project_path.resolve()
+    assert _find_kedro_project(project_path) == project_path.resolve()
+
+
+class TestLazyLineMagic:
+    def test_name(self, mocker):
+        entry_point = mocker.Mock(attr="launchers.run_viz")
+        assert _LazyLineMagic(entry_point).__name__ == "run_viz"
+
+    def test_name_module_entry_point(self, mocker):
+        entry_point = mocker.Mock(attr=None)
+        entry_point.name = "run_viz"
+        assert _LazyLineMagic(entry_point).__name__ == "run_viz"
+
+    def test_load_failure_skipped(self, mocker):
+        """Test that a magic which fails to load only logs a warning."""
+        entry_point = mocker.Mock(attr="abc")
+        entry_point.load.side_effect = ImportError("missing dependency")
+        mock_logger = mocker.patch("kedro.framework.cli.utils.logger")
+
+        assert _LazyLineMagic(entry_point)("--arg") is None
+        mock_logger.warning.assert_called_once()
+
+    def test_load_on_first_call(self, mocker):
+        entry_point = mocker.Mock(attr="abc")
+        line_magic = _LazyLineMagic(entry_point)
+        entry_point.load.assert_not_called()
+
+        local_ns = {"a": 1}
+        result = line_magic("--arg", local_ns=local_ns)
+        line_magic("--other-arg")
+
+        entry_point.load.assert_called_once_with()
+        loaded_magic = entry_point.load.return_value
+        assert result == loaded_magic.return_value
+        assert loaded_magic.call_args_list == [
+            mocker.call("--arg", local_ns=local_ns),
+            mocker.call("--other-arg", local_ns=None),
+        ]
+
+    def test_registered_with_ipython(self, mocker, ipython):
+        entry_point = mocker.Mock(attr="lazy_kedro_magic")
+        ipython.register_magic_function(needs_local_scope(_LazyLineMagic(entry_point)))
+
+        ipython.run_line_magic("lazy_kedro_magic", "some args")
+        loaded_magic = entry_point.load.return_value
+        loaded_magic.assert_called_once_with("some args", local_ns=mocker.ANY)
+        assert isinstance(loaded_magic.call_args[1]["local_ns"], dict)
+
+    def test_help_from_loaded_magic(self, mocker, ipython):
+        """Test that the help of the magic is the docstring of the loaded magic,
+        which is only imported when the help is requested."""
+
+        def lazy_doc_magic(line, local_ns=None):  # pylint: disable=unused-argument
+            """Help of the magic."""
+
+        entry_point = mocker.Mock(attr="lazy_doc_magic")
+        entry_point.load.return_value = lazy_doc_magic
+        ipython.register_magic_function(needs_local_scope(_LazyLineMagic(entry_point)))
+        entry_point.load.assert_not_called()
+
+        info = ipython.object_inspect("%lazy_doc_magic")
+        assert info["docstring"] == "Help of the magic."
+
+
+class TestBootstrapProject:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        yield
+        _cached_project_metadata.cache_clear()
+
+    @pytest.fixture
+    def mock_get_metadata(self, mocker):
+        return mocker.patch("kedro.ipython._get_project_metadata")
+
+    def test_metadata_cached(self, tmp_path, mocker, mock_get_metadata):
+        pyproject_toml = tmp_path / "pyproject.toml"
+        pyproject_toml.touch()
+        mock_add_src_to_path = mocker.patch("kedro.ipython._add_src_to_path")
+        mock_configure_project = mocker.patch("kedro.ipython.configure_project")
+        metadata = mock_get_metadata.return_value
+
+        assert _bootstrap_project(tmp_path) == metadata
+        _bootstrap_project(tmp_path)
+        mock_get_metadata.assert_called_once_with(tmp_path)
+
+        # the source directory is added to the path on every call
+        assert (
+            mock_add_src_to_path.call_args_list
+            == [mocker.call(metadata.source_dir, tmp_path)] * 2
+        )
+        assert (
+            mock_configure_project.call_args_list
+            == [mocker.call(metadata.package_name)] * 2
+        )
+
+        # modifying `pyproject.toml` reads the project metadata again
+        os.utime(pyproject_toml, (0, 0))
+        _bootstrap_project(tmp_path)
+        assert mock_get_metadata.call_count == 2
+
+    def test_bootstrap_no_pyproject(self, tmp_path, mock_get_metadata):
+        mock_get_metadata.side_effect = RuntimeError
+
+        with pytest.raises(RuntimeError):
+            _bootstrap_project(tmp_path)
+        with pytest.raises(RuntimeError):
+            _bootstrap_project(tmp_path)
+        assert mock_get_metadata.call_count == 2
+
+
 class TestLoadIPythonExtension:
     def test_load_ipython_extension(self, ipython):
         ipython.magic("load_ext kedro.ipython")